@@ -7,13 +7,16 @@ To run the example use the command `pdm run example`."""
 import argparse
 import asyncio
 import contextlib
+import functools
+import logging
+import logging.handlers
+import queue
 import sys
+from typing import Optional
 
 import pyairtouch
 
-
-def msg(msg: str) -> None:
-    print(msg, file=sys.stderr)
+_LOGGER = logging.getLogger(__name__)
 
 
 def parse_args() -> argparse.Namespace:
@@ -35,6 +38,11 @@ def parse_args() -> argparse.Namespace:
         default=300.0,
         required=False,
     )
+    p.add_argument(
+        "--first-only",
+        help="Only monitor the first discovered AirTouch to finish initialising.",
+        action="store_true",
+    )
     return p.parse_args()
 
 
@@ -42,40 +50,63 @@ def _airtouch_id(airtouch: pyairtouch.AirTouch) -> str:
     return f"{airtouch.name} ({airtouch.host})"
 
 
-async def _monitor_airtouch(airtouch: pyairtouch.AirTouch, duration: float) -> None:
-    """Monitor an AirTouch for a fixed duration."""
-    success = await airtouch.init()
-    if not success:
-        msg(f"{_airtouch_id(airtouch)} initialisation failed")
+def _format_temp(temperature: Optional[float]) -> str:
+    if temperature is None:
+        return "-"
+    return f"{temperature:.1f}"
+
+
+async def _on_ac_status_updated(airtouch: pyairtouch.AirTouch, ac_id: int) -> None:
+    if not _LOGGER.isEnabledFor(logging.INFO):
         return
 
-    msg(f"{_airtouch_id(airtouch)} initialised. Monitoring for {duration} seconds")
+    _LOGGER.info("%s AC %d status updated", _airtouch_id(airtouch), ac_id)
+    aircon = airtouch.air_conditioners[ac_id]
+    _LOGGER.info(
+        "  AC Status  : %s %s %s temp=%.1f set_point=%.1f",
+        aircon.power_state.name,
+        aircon.active_mode.name,
+        aircon.active_fan_speed.name,
+        aircon.current_temperature,
+        aircon.target_temperature,
+    )
 
-    async def _on_ac_status_updated(ac_id: int) -> None:
-        msg(f"{_airtouch_id(airtouch)} AC {ac_id} status updated")
-        aircon = airtouch.air_conditioners[ac_id]
-        msg(
-            f"  AC Status  : {aircon.power_state.name} "
-            f"{aircon.active_mode.name} {aircon.active_fan_speed.name} "
-            f"temp={aircon.current_temperature:.1f} "
-            f"set_point={aircon.target_temperature:.1f}"
+    for zone in aircon.zones:
+        _LOGGER.info(
+            "  Zone Status: %-10s %-3s  temp=%s set_point=%s damper=%d",
+            zone.name,
+            zone.power_state.name,
+            _format_temp(zone.current_temperature),
+            _format_temp(zone.target_temperature),
+            zone.current_damper_percentage,
         )
+    _LOGGER.info("")  # Blank line to separate from subsequent logs.
 
-        for zone in aircon.zones:
-            msg(
-                f"  Zone Status: {zone.name:10} {zone.power_state.name:3}  "
-                f"temp={zone.current_temperature:.1f} "
-                f"set_point={zone.target_temperature:.1f} "
-                f"damper={zone.current_damper_percentage}"
-            )
-        msg("")  # Blank line to separate from subsequent logs.
+
+async def _init_airtouch(airtouch: pyairtouch.AirTouch) -> bool:
+    success = await airtouch.init()
+    if not success:
+        _LOGGER.info("%s initialisation failed", _airtouch_id(airtouch))
+    return success
+
+
+async def _monitor_initialised_airtouch(
+    airtouch: pyairtouch.AirTouch, duration: float
+) -> None:
+    _LOGGER.info(
+        "%s initialised. Monitoring for %s seconds", _airtouch_id(airtouch), duration
+    )
+
+    on_ac_status_updated = functools.partial(_on_ac_status_updated, airtouch)
 
     # Subscribe to AC status updates:
     for aircon in airtouch.air_conditioners:
-        aircon.subscribe(_on_ac_status_updated)
+        aircon.subscribe(on_ac_status_updated)
 
-        # Print initial status
-        await _on_ac_status_updated(aircon.ac_id)
+    # Print initial status
+    await asyncio.gather(
+        *(on_ac_status_updated(aircon.ac_id) for aircon in airtouch.air_conditioners)
+    )
 
     # Run the monitor for the specified duration
     await asyncio.sleep(duration)
@@ -83,21 +114,73 @@ async def _monitor_airtouch(airtouch: pyairtouch.AirTouch, duration: float) -> N
     await airtouch.shutdown()
 
 
+async def _monitor_airtouch(airtouch: pyairtouch.AirTouch, duration: float) -> None:
+    """Monitor an AirTouch for a fixed duration."""
+    if await _init_airtouch(airtouch):
+        await _monitor_initialised_airtouch(airtouch, duration)
+
+
+async def _monitor_first_airtouch(
+    airtouches: list[pyairtouch.AirTouch], duration: float
+) -> None:
+    """Monitor whichever AirTouch is first to initialise successfully."""
+    init_tasks = {
+        asyncio.create_task(_init_airtouch(airtouch)): airtouch
+        for airtouch in airtouches
+    }
+
+    first: Optional[pyairtouch.AirTouch] = None
+    pending = set(init_tasks)
+    try:
+        while pending and not first:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if exception := task.exception():
+                    _LOGGER.error(
+                        "%s initialisation raised an exception",
+                        _airtouch_id(init_tasks[task]),
+                        exc_info=exception,
+                    )
+                elif task.result() and not first:
+                    first = init_tasks[task]
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        # Release the connections to all of the AirTouch systems we won't monitor.
+        for airtouch in airtouches:
+            if airtouch is not first:
+                await airtouch.shutdown()
+
+    if not first:
+        _LOGGER.info("No AirTouch initialised successfully")
+        return
+
+    await _monitor_initialised_airtouch(first, duration)
+
+
 async def main(args: argparse.Namespace) -> None:
     # Automatically discover AirTouch devices on the network.
     if args.airtouch_host:
-        print(f"Searching for AirTouch at {args.airtouch_host}")
+        _LOGGER.info("Searching for AirTouch at %s", args.airtouch_host)
     else:
-        print("Searching for all AirTouch systems on the network")
+        _LOGGER.info("Searching for all AirTouch systems on the network")
 
     discovered_airtouches = await pyairtouch.discover(args.airtouch_host)
     if not discovered_airtouches:
-        print("No AirTouch discovered")
+        _LOGGER.info("No AirTouch discovered")
         return
 
-    print(f"Discovered {len(discovered_airtouches)} AirTouch systems:")
+    _LOGGER.info("Discovered %d AirTouch systems:", len(discovered_airtouches))
     for airtouch in discovered_airtouches:
-        print(f"  {airtouch.name} ({airtouch.host})")
+        _LOGGER.info("  %s", _airtouch_id(airtouch))
+
+    if args.first_only:
+        await _monitor_first_airtouch(discovered_airtouches, args.duration)
+        return
 
     # Monitor all discovered AirTouch systems
     async with asyncio.TaskGroup() as tg:
@@ -105,7 +188,27 @@ async def main(args: argparse.Namespace) -> None:
             tg.create_task(_monitor_airtouch(airtouch, args.duration))
 
 
+def _start_logging() -> logging.handlers.QueueListener:
+    """Log via a queue so that writing to stderr doesn't block the event loop."""
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    logging.basicConfig(
+        format="%(message)s",
+        level=logging.INFO,
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+    )
+
+    listener = logging.handlers.QueueListener(
+        log_queue, logging.StreamHandler(sys.stderr)
+    )
+    listener.start()
+    return listener
+
+
 if __name__ == "__main__":
     args = parse_args()
-    with contextlib.suppress(KeyboardInterrupt):
-        asyncio.run(main(args))
+    listener = _start_logging()
+    try:
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(main(args))
+    finally:
+        listener.stop()
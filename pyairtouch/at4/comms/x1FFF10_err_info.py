@@ -62,16 +62,20 @@ class AcErrorInformationEncoder(
     Handles both the message and request since they share a common message ID.
     """
 
+    def __init__(self) -> None:
+        """Initialise the AcErrorInformationEncoder."""
+        # size() and encode() are called back to back for the same message, so
+        # remember the most recently encoded string to avoid encoding it twice.
+        self._last_encoded: Optional[tuple[str, bytes]] = None
+
     @override
     def size(
         self, message: AcErrorInformationMessage | AcErrorInformationRequest
     ) -> int:
         if isinstance(message, AcErrorInformationRequest):
             return 1  # AC number only
-        # Will result in the string being encoded twice, but we don't expect to
-        # encode this message very often, so there's no need to optimise this.
-        if message.error_info:
-            return 2 + len(message.error_info.encode(encoding=encoding.STRING_ENCODING))
+        if message.error_info is not None:
+            return 2 + len(self._encode_error_info(message.error_info))
         return 2
 
     @override
@@ -84,10 +88,8 @@ class AcErrorInformationEncoder(
         buffer.append(message.ac_number & 0xFF)
 
         if isinstance(message, AcErrorInformationMessage):
-            if message.error_info:
-                error_string = message.error_info.encode(
-                    encoding=encoding.STRING_ENCODING
-                )
+            if message.error_info is not None:
+                error_string = self._encode_error_info(message.error_info)
                 buffer.append(len(error_string))
                 buffer.extend(error_string)
             else:
@@ -95,6 +97,14 @@ class AcErrorInformationEncoder(
 
         return buffer
 
+    def _encode_error_info(self, error_info: str) -> bytes:
+        if self._last_encoded is None or self._last_encoded[0] != error_info:
+            self._last_encoded = (
+                error_info,
+                error_info.encode(encoding=encoding.STRING_ENCODING),
+            )
+        return self._last_encoded[1]
+
 
 class AcErrorInformationDecoder(
     comms.MessageDecoder[
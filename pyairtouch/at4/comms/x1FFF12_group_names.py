@@ -11,6 +11,7 @@ Message, a common encoder and decoder are used.
 This message is a sub-message of the Extended Message.
 """  # noqa: N999
 
+import struct
 from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Literal
@@ -25,7 +26,7 @@ from pyairtouch.comms import MessageDecodeResult, encoding
 MESSAGE_ID = 0xFF12
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupNamesMessage(comms.Message):
     """The Group Names Message."""
 
@@ -41,7 +42,7 @@ class GroupNamesMessage(comms.Message):
         return MESSAGE_ID
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupNamesRequest(comms.Message):
     """Request for Group Names."""
 
@@ -61,6 +62,7 @@ _PER_GROUP_SIZE = 1 + _GROUP_NAME_LENGTH
 
 One byte for the group number, then the group name.
 """
+_GROUP_STRUCT = struct.Struct(f"!B{_GROUP_NAME_LENGTH}s")
 
 
 class GroupNamesEncoder(
@@ -91,10 +93,16 @@ class GroupNamesEncoder(
                 return b""  # No content
             return bytes((message.group_number,))
 
-        buffer = bytearray()
-        for group_number, group_name in message.group_names.items():
-            buffer.append(group_number)
-            buffer.extend(encoding.encode_c_string(group_name, _GROUP_NAME_LENGTH))
+        encode_c_string = encoding.encode_c_string
+        pack_into = _GROUP_STRUCT.pack_into
+        buffer = bytearray(_PER_GROUP_SIZE * len(message.group_names))
+        for index, (group_number, group_name) in enumerate(message.group_names.items()):
+            pack_into(
+                buffer,
+                index * _PER_GROUP_SIZE,
+                group_number,
+                encode_c_string(group_name, _GROUP_NAME_LENGTH),
+            )
         return buffer
 
 
@@ -133,16 +141,18 @@ class GroupNamesDecoder(
                 f"a multiple of the group data size ({_PER_GROUP_SIZE})."
             )
 
+        decode_c_string = encoding.decode_c_string
+        offset = 0
         group_names: dict[int, str] = {}
         for _ in range(header.message_length // _PER_GROUP_SIZE):
-            group_number = buffer[0]
-            group_name = encoding.decode_c_string(buffer[1:_PER_GROUP_SIZE])
+            group_number = buffer[offset]
+            group_name = decode_c_string(buffer[offset + 1 : offset + _PER_GROUP_SIZE])
 
             group_names[group_number] = group_name
 
-            buffer = buffer[_PER_GROUP_SIZE:]
+            offset += _PER_GROUP_SIZE
 
         return comms.MessageDecodeResult(
             message=GroupNamesMessage(group_names),
-            remaining=buffer,
+            remaining=buffer[offset:],
         )
@@ -15,6 +15,7 @@ This message is a sub-message of the Control Command and Status Message.
 """  # noqa: N999
 
 import enum
+import functools
 import logging
 import struct
 from collections.abc import Sequence
@@ -25,7 +26,6 @@ from typing_extensions import override
 
 from pyairtouch import comms
 from pyairtouch.at5.comms import utils, xC0_ctrl_status
-from pyairtouch.comms import encoding
 
 MESSAGE_ID = 0x21
 
@@ -54,7 +54,7 @@ class SensorBatteryStatus(enum.Enum):
     LOW = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoneStatusData:
     """Status data for a zone in the AirTouch system."""
 
@@ -82,7 +82,7 @@ class ZoneStatusData:
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoneStatusMessage(comms.Message):
     """The Zone Status Message."""
 
@@ -94,7 +94,7 @@ class ZoneStatusMessage(comms.Message):
         return MESSAGE_ID
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoneStatusRequest(comms.Message):
     """Request for Zone Status Data."""
 
@@ -106,11 +106,34 @@ class ZoneStatusRequest(comms.Message):
 
 _STRUCT = struct.Struct("!BBBBHBx")
 
+# Lookup tables for decoding enum values without the overhead of calling the
+# enum class.
+_POWER_STATE_MAP = {s.value: s for s in ZonePowerState}
+_CONTROL_METHOD_MAP = {m.value: m for m in ZoneControlMethod}
+_BATTERY_STATUS_MAP = {s.value: s for s in SensorBatteryStatus}
+
+_REPEAT_SIZE: dict[type[comms.Message], int] = {
+    ZoneStatusMessage: _STRUCT.size,
+    ZoneStatusRequest: 0,  # Requests have no content
+}
+
 _INVALID_SET_POINT = 0xFF
 _INVALID_TEMPERATURE = 0x07FF  # Based on the examples.
 _MAXIMUM_TEMPERATURE = 150.0  # From the communication protocol.
 
 
+@functools.lru_cache(maxsize=4)
+def _zone_struct(repeat_length: int) -> struct.Struct:
+    """Struct for decoding the Zone Status Data of a single zone.
+
+    The struct is padded out to the repeat length so that any unknown trailing
+    bytes in each zone's data are skipped.
+    """
+    if repeat_length == _STRUCT.size:
+        return _STRUCT
+    return struct.Struct(f"{_STRUCT.format}{repeat_length - _STRUCT.size}x")
+
+
 class ZoneStatusEncoder(
     xC0_ctrl_status.ControlStatusSubEncoder[ZoneStatusMessage | ZoneStatusRequest]
 ):
@@ -132,9 +155,7 @@ class ZoneStatusEncoder(
 
     @override
     def repeat_size(self, message: ZoneStatusMessage | ZoneStatusRequest) -> int:
-        if isinstance(message, ZoneStatusRequest):
-            return 0
-        return _STRUCT.size
+        return _REPEAT_SIZE.get(type(message), 0)
 
     @override
     def encode(
@@ -146,66 +167,30 @@ class ZoneStatusEncoder(
             # ZoneStatusRequest has no content
             return b""
 
-        buffer = bytearray()
+        # Pre-allocate the full buffer so each zone can be packed in place.
+        buffer = bytearray(_STRUCT.size * len(message.zones))
+        pack_into = _STRUCT.pack_into
+        encode_set_point = utils.encode_set_point
+        encode_temperature = utils.encode_temperature
+        offset = 0
         for zone in message.zones:
-            encoded_zone_number = self._encode_zone_number(zone.zone_number)
-            encoded_power_state = self._encode_power_state(zone.power_state)
-            encoded_control_method = self._encode_control_method(zone.control_method)
-            encoded_open_percentage = self._encode_open_percentage(
-                zone.damper_percentage
-            )
-            encoded_set_point = self._encode_set_point(zone.set_point)
-            encoded_has_sensor = self._encode_has_sensor(zone.has_sensor)
-            encoded_temperature = self._encode_temperature(zone.temperature)
-            encoded_spill_active = self._encode_spill_active(zone.spill_active)
-            encoded_low_battery = self._encode_low_battery(zone.battery_status)
-
-            b1 = encoded_zone_number + encoded_power_state
-            b2 = encoded_control_method + encoded_open_percentage
-            b7 = encoded_spill_active + encoded_low_battery
-            buffer.extend(
-                _STRUCT.pack(
-                    b1,
-                    b2,
-                    encoded_set_point,
-                    encoded_has_sensor,
-                    encoded_temperature,
-                    b7,
-                )
+            pack_into(
+                buffer,
+                offset,
+                (zone.zone_number & 0x3F) | (zone.power_state.value << 6),
+                (zone.control_method.value << 7) | (zone.damper_percentage & 0x7F),
+                _INVALID_SET_POINT
+                if zone.set_point is None
+                else encode_set_point(zone.set_point),
+                0x80 if zone.has_sensor else 0x00,
+                _INVALID_TEMPERATURE
+                if zone.temperature is None
+                else encode_temperature(zone.temperature) & 0x07FF,
+                (0x02 if zone.spill_active else 0x00) | zone.battery_status.value,
             )
+            offset += _STRUCT.size
         return buffer
 
-    def _encode_zone_number(self, zone_number: int) -> int:
-        return zone_number & 0x3F
-
-    def _encode_power_state(self, power_state: ZonePowerState) -> int:
-        return power_state.value << 6
-
-    def _encode_control_method(self, control_method: ZoneControlMethod) -> int:
-        return control_method.value << 7
-
-    def _encode_open_percentage(self, damper_percentage: int) -> int:
-        return damper_percentage & 0x7F
-
-    def _encode_set_point(self, set_point: Optional[float]) -> int:
-        if set_point:
-            return utils.encode_set_point(set_point)
-        return _INVALID_SET_POINT
-
-    def _encode_has_sensor(self, has_sensor: bool) -> int:  # noqa: FBT001
-        return encoding.bool_to_bit(has_sensor, 7)
-
-    def _encode_temperature(self, temperature: Optional[float]) -> int:
-        if temperature:
-            return utils.encode_temperature(temperature) & 0x07FF
-        return _INVALID_TEMPERATURE
-
-    def _encode_spill_active(self, spill_active: bool) -> int:  # noqa: FBT001
-        return encoding.bool_to_bit(spill_active, 1)
-
-    def _encode_low_battery(self, battery_status: SensorBatteryStatus) -> int:
-        return battery_status.value
-
 
 class ZoneStatusDecoder(
     comms.MessageDecoder[
@@ -250,66 +235,58 @@ class ZoneStatusDecoder(
             )
             self._mismatch_logged = True
 
+        zones_size = header.repeat_length * header.repeat_count
+        if len(buffer) < zones_size:
+            raise comms.DecodeError(
+                f"Buffer length ({len(buffer)}) < "
+                f"Zone Status Data size for {header.repeat_count} zones ({zones_size})"
+            )
+        zone_struct = _zone_struct(header.repeat_length)
+
+        # Bind frequently used globals to locals for the per-zone loop.
+        decode_temperature = utils.decode_temperature
+        decode_set_point = utils.decode_set_point
+        power_state_map = _POWER_STATE_MAP
+        control_method_map = _CONTROL_METHOD_MAP
+        battery_status_map = _BATTERY_STATUS_MAP
+        zone_status_data = ZoneStatusData
+
         zones: list[ZoneStatusData] = []
-        for _ in range(header.repeat_count):
-            (
-                b1,
-                b2,
-                set_point_raw,
-                b4,
-                temp_raw,
-                b7,
-            ) = _STRUCT.unpack_from(buffer)
-            has_sensor = self._decode_has_sensor(b4)
+        for (
+            b1,
+            b2,
+            set_point_raw,
+            b4,
+            temp_raw,
+            b7,
+        ) in zone_struct.iter_unpack(memoryview(buffer)[:zones_size]):
+            has_sensor = bool(b4 & 0x80)
+
+            temperature: Optional[float] = None
+            if has_sensor:
+                temperature = decode_temperature(temp_raw & 0x07FF)
+                if temperature > _MAXIMUM_TEMPERATURE:
+                    temperature = None
+
+            set_point: Optional[float] = None
+            if set_point_raw != _INVALID_SET_POINT:
+                set_point = decode_set_point(set_point_raw)
+
             zones.append(
-                ZoneStatusData(
-                    zone_number=self._decode_zone_number(b1),
-                    power_state=self._decode_power_state(b1),
-                    spill_active=self._decode_spill_active(b7),
-                    control_method=self._decode_control_method(b2),
+                zone_status_data(
+                    zone_number=b1 & 0x3F,
+                    power_state=power_state_map[(b1 >> 6) & 0x03],
+                    spill_active=bool(b7 & 0x02),
+                    control_method=control_method_map[(b2 >> 7) & 0x01],
                     has_sensor=has_sensor,
-                    battery_status=self._decode_battery_status(b7),
-                    temperature=self._decode_temperature(has_sensor, temp_raw),
-                    damper_percentage=self._decode_damper_percentage(b2),
-                    set_point=self._decode_set_point(set_point_raw),
+                    battery_status=battery_status_map[b7 & 0x01],
+                    temperature=temperature,
+                    damper_percentage=b2 & 0x7F,
+                    set_point=set_point,
                 )
             )
-            # Progress by the repeat length which will just skip over any unknown bytes.
-            buffer = buffer[header.repeat_length :]
 
         return comms.MessageDecodeResult(
             message=ZoneStatusMessage(zones=zones),
-            remaining=buffer,
+            remaining=buffer[zones_size:],
         )
-
-    def _decode_zone_number(self, byte1: int) -> int:
-        return byte1 & 0x3F
-
-    def _decode_power_state(self, byte1: int) -> ZonePowerState:
-        return ZonePowerState((byte1 & 0xC0) >> 6)
-
-    def _decode_spill_active(self, byte7: int) -> bool:
-        return encoding.bit_to_bool(byte7, 1)
-
-    def _decode_control_method(self, byte2: int) -> ZoneControlMethod:
-        return ZoneControlMethod((byte2 & 0x80) >> 7)
-
-    def _decode_has_sensor(self, byte4: int) -> bool:
-        return encoding.bit_to_bool(byte4, 7)
-
-    def _decode_temperature(self, has_sensor: bool, temp_raw: int) -> Optional[float]:  # noqa: FBT001
-        decoded_temperature = utils.decode_temperature(temp_raw & 0x07FF)
-        if not has_sensor or decoded_temperature > _MAXIMUM_TEMPERATURE:
-            return None
-        return decoded_temperature
-
-    def _decode_battery_status(self, byte7: int) -> SensorBatteryStatus:
-        return SensorBatteryStatus(byte7 & 0x01)
-
-    def _decode_damper_percentage(self, b2: int) -> int:
-        return b2 & 0x7F
-
-    def _decode_set_point(self, set_point_raw: int) -> Optional[float]:
-        if set_point_raw == _INVALID_SET_POINT:
-            return None
-        return utils.decode_set_point(set_point_raw)
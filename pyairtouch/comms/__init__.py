@@ -39,6 +39,9 @@ Hdr_contra = TypeVar("Hdr_contra", bound=Header, contravariant=True)
 class Message(Protocol):
     """Defines the interface for messages."""
 
+    # Allow slotted message implementations to avoid a per-instance __dict__.
+    __slots__ = ()
+
     @property
     def message_id(self) -> int:
         """The message's ID."""
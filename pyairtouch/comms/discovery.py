@@ -1,8 +1,12 @@
 """AirTouch discovery communication."""
 
 import asyncio
+import contextlib
+import ipaddress
+import logging
 import socket
-from collections.abc import Callable, Coroutine, Sequence
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from typing import Any, Generic, Optional
 
 from typing_extensions import override
@@ -17,6 +21,8 @@ _DISCOVERY_REQUEST_INTERVAL = 0.5
 _DISCOVERY_MAX_REQUESTS = 3
 """Maximum amount of discovery requests to send before giving up."""
 
+_ResponseCallback = Callable[[comms.TDiscoveryResponse], None]
+
 
 class AirTouchDiscoverer(Generic[comms.DiscoveryRequest_co, comms.TDiscoveryResponse]):
     """Discovers AirTouch consoles on the network.
@@ -24,6 +30,8 @@ class AirTouchDiscoverer(Generic[comms.DiscoveryRequest_co, comms.TDiscoveryResp
     Performs discovery in accordance with a specific discovery configuration.
     """
 
+    __slots__ = ("_discovery_config", "_remote_address", "_remote_host", "_unicast")
+
     def __init__(
         self,
         discovery_config: comms.DiscoveryConfig[
@@ -39,9 +47,14 @@ class AirTouchDiscoverer(Generic[comms.DiscoveryRequest_co, comms.TDiscoveryResp
                 not provided discovery messages will be broadcast.
         """
         self._discovery_config = discovery_config
-        self._remote_host: str = "255.255.255.255"
-        if remote_host:
-            self._remote_host = remote_host
+        self._unicast = bool(remote_host)
+        self._remote_host = remote_host or "255.255.255.255"
+
+        # Numeric addresses can be used as is. Host names are resolved by
+        # each search.
+        self._remote_address: Optional[tuple[str, int]] = None
+        if _is_ip_address(self._remote_host):
+            self._remote_address = (self._remote_host, discovery_config.remote_port)
 
     async def search(self) -> Sequence[comms.TDiscoveryResponse]:
         """Initiate a search for AirTouch consoles on the network.
@@ -49,57 +62,100 @@ class AirTouchDiscoverer(Generic[comms.DiscoveryRequest_co, comms.TDiscoveryResp
         There is no need to use a timeout for the search. It will terminate
         after a reasonable period if no AirTouch consoles are discovered.
         """
-        # Use a set to filter out any duplicates that might slip through
-        responses: set[comms.TDiscoveryResponse] = set()
+        remote_address = await self._resolve_remote_address()
+        if not remote_address:
+            return []
 
-        transport = await self._open_socket(responses)
+        responses: list[comms.TDiscoveryResponse] = []
+        responses_received = asyncio.Event()
 
-        request = self._discovery_config.request_factory()
-        remote_address = (self._remote_host, self._discovery_config.remote_port)
+        def on_discovery_response(response: comms.TDiscoveryResponse) -> None:
+            # Filter out any duplicates that might slip through. Only a handful
+            # of responses are expected so a linear search is fine.
+            if response not in responses:
+                responses.append(response)
+            responses_received.set()
+
+        transport = await self._open_socket(on_discovery_response)
+
+        request_data = self._discovery_config.request_factory().data
+        sendto = transport.sendto
 
         count = 0
         while not responses and count < _DISCOVERY_MAX_REQUESTS:
             count += 1
-            _LOGGER.debug(
-                "Sending discovery request (%d): %s",
-                count,
-                request.data,
-            )
-            transport.sendto(request.data, remote_address)
-            # We always wait for the full interval instead of exiting after the
-            # first response to allow time for multiple AirTouch consoles to reply.
-            await asyncio.sleep(_DISCOVERY_REQUEST_INTERVAL)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Sending discovery request (%d): %s",
+                    count,
+                    request_data,
+                )
+            sendto(request_data, remote_address)
+            if self._unicast:
+                # Only the targeted console can reply, so finish as soon as it does.
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        responses_received.wait(), timeout=_DISCOVERY_REQUEST_INTERVAL
+                    )
+            else:
+                # We always wait for the full interval instead of exiting after
+                # the first response to allow time for multiple AirTouch
+                # consoles to reply.
+                await asyncio.sleep(_DISCOVERY_REQUEST_INTERVAL)
 
         transport.close()
 
-        return list(responses)
+        return responses
+
+    async def _resolve_remote_address(self) -> Optional[tuple[str, int]]:
+        """Resolve the remote host to an IPv4 address for sending requests.
+
+        Host names are looked up once per search rather than by every send.
+
+        Returns:
+            The resolved address, or None if the host couldn't be resolved.
+        """
+        if self._remote_address:
+            return self._remote_address
+
+        try:
+            address_info = await asyncio.get_running_loop().getaddrinfo(
+                self._remote_host,
+                self._discovery_config.remote_port,
+                family=socket.AF_INET,
+                type=socket.SOCK_DGRAM,
+            )
+        except OSError as ex:
+            _LOGGER.warning(
+                "Unable to resolve discovery host %s: %s", self._remote_host, ex
+            )
+            return None
+        host, port = address_info[0][4][:2]
+        return (str(host), int(port))
 
     async def _open_socket(
-        self, responses: set[comms.TDiscoveryResponse]
+        self, callback: _ResponseCallback[comms.TDiscoveryResponse]
     ) -> asyncio.DatagramTransport:
-        """Open a socket for sending/receiving broadcast discovery messages.
+        """Open a socket for sending/receiving discovery messages.
 
         Args:
-            responses: a list in which to store responses.
+            callback: called with each received discovery response.
         """
         sock = socket.socket(
             family=socket.AF_INET, type=socket.SOCK_DGRAM, proto=socket.IPPROTO_UDP
         )
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        if not self._unicast:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
 
         local_address = ("0.0.0.0", self._discovery_config.local_port)  # noqa: S104 (binding to all interfaces is intentional)
         sock.bind(local_address)
 
-        async def on_discovery_reponse(response: comms.TDiscoveryResponse) -> None:
-            responses.add(response)
-
         loop = asyncio.get_running_loop()
         transport, _ = await loop.create_datagram_endpoint(
             protocol_factory=lambda: _DiscoveryDecodeProtocol(
-                loop=loop,
                 response_type=self._discovery_config.response_type,
                 decoder=self._discovery_config.decoder,
-                callback=on_discovery_reponse,
+                callback=callback,
             ),
             sock=sock,
         )
@@ -107,45 +163,41 @@ class AirTouchDiscoverer(Generic[comms.DiscoveryRequest_co, comms.TDiscoveryResp
         return transport
 
 
-_ResponseCallback = Callable[[comms.TDiscoveryResponse], Coroutine[Any, Any, None]]
+def _is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
 
 
+@dataclass(frozen=True, slots=True)
 class _DiscoveryDecodeProtocol(
     asyncio.DatagramProtocol,
     Generic[comms.DiscoveryRequest_co, comms.TDiscoveryResponse],
 ):
-    def __init__(
-        self,
-        loop: asyncio.AbstractEventLoop,
-        decoder: comms.DiscoveryDecoder[
-            comms.DiscoveryRequest_co, comms.TDiscoveryResponse
-        ],
-        response_type: type[comms.TDiscoveryResponse],
-        callback: _ResponseCallback[comms.TDiscoveryResponse],
-    ) -> None:
-        self._loop = loop
-        self._decoder = decoder
-        self._response_type = response_type
-        self._callback = callback
-
-        self._background_tasks: set[asyncio.Task[Any]] = set()
+    decoder: comms.DiscoveryDecoder[comms.DiscoveryRequest_co, comms.TDiscoveryResponse]
+    response_type: type[comms.TDiscoveryResponse]
+    callback: _ResponseCallback[comms.TDiscoveryResponse]
 
     @override
     def datagram_received(self, data: bytes, addr: tuple[str | Any, int]) -> None:
-        _LOGGER.debug("Received datagram: %s", data)
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug("Received datagram: %s", data)
 
-        if not self._decoder.match(data):
-            _LOGGER.debug("... Message      : <unknown>")
+        if not self.decoder.match(data):
+            if debug_enabled:
+                _LOGGER.debug("... Message      : <unknown>")
             return
 
         try:
-            message = self._decoder.decode(data)
-            _LOGGER.debug("... Message      : %s", message)
+            message = self.decoder.decode(data)
+            if debug_enabled:
+                _LOGGER.debug("... Message      : %s", message)
 
-            if isinstance(message, self._response_type):
-                task = self._loop.create_task(self._callback(message))
-                self._background_tasks.add(task)
-                task.add_done_callback(self._background_tasks.discard)
+            if isinstance(message, self.response_type):
+                self.callback(message)
 
         except comms.DecodeError:
             _LOGGER.exception("Error decoding discovery response")
@@ -1,6 +1,7 @@
 """Tests for the Zone Status message encoder and decoder."""  # noqa: N999
 
 import pytest
+from pyairtouch import comms
 from pyairtouch.at5.comms.xC0_ctrl_status import ControlStatusSubHeader
 from pyairtouch.at5.comms.xC021_zone_status import (
     MESSAGE_ID,
@@ -148,6 +149,27 @@ def generate_header(
             ),
             bytes((0x00, 0x00, 0xFF, 0x00, 0x07, 0xFF, 0b00000001, 0x00)),
         ),
+        #
+        # Testing a temperature of zero degrees
+        #
+        (
+            ZoneStatusMessage(
+                zones=[
+                    ZoneStatusData(
+                        zone_number=0,
+                        power_state=ZonePowerState.OFF,
+                        spill_active=False,
+                        control_method=ZoneControlMethod.DAMPER,
+                        has_sensor=True,
+                        battery_status=SensorBatteryStatus.NORMAL,
+                        temperature=0.0,
+                        damper_percentage=0,
+                        set_point=None,
+                    )
+                ]
+            ),
+            bytes((0x00, 0x00, 0xFF, 0x80, 0x01, 0xF4, 0x00, 0x00)),
+        ),
     ],
 )
 class TestZoneStatusEncoderDecoder:
@@ -171,3 +193,107 @@ class TestZoneStatusEncoderDecoder:
 
         decode_result.assert_complete()
         assert message == decode_result.message
+
+
+def test_decoder_extra_repeat_bytes() -> None:
+    """Unknown trailing bytes in each zone's data should be skipped."""
+    decoder = ZoneStatusDecoder()
+    header = ControlStatusSubHeader(
+        sub_message_id=MESSAGE_ID,
+        non_repeat_length=0,
+        repeat_length=10,
+        repeat_count=2,
+    )
+    message_buffer = bytes(
+        (
+            # Zone 1
+            0x40,
+            0x80,
+            0x96,
+            0x80,
+            0x02,
+            0xE7,
+            0x00,
+            0x00,
+            0xAA,
+            0xBB,
+            # Zone 2
+            0x01,
+            0x64,
+            0xFF,
+            0x00,
+            0x07,
+            0xFF,
+            0x00,
+            0x00,
+            0xCC,
+            0xDD,
+        )
+    )
+
+    decode_result = decoder.decode(message_buffer, header)
+
+    decode_result.assert_complete()
+    assert decode_result.message == ZoneStatusMessage(
+        zones=[
+            ZoneStatusData(
+                zone_number=0,
+                power_state=ZonePowerState.ON,
+                spill_active=False,
+                control_method=ZoneControlMethod.TEMPERATURE,
+                has_sensor=True,
+                battery_status=SensorBatteryStatus.NORMAL,
+                temperature=24.3,
+                damper_percentage=0,
+                set_point=25.0,
+            ),
+            ZoneStatusData(
+                zone_number=1,
+                power_state=ZonePowerState.OFF,
+                spill_active=False,
+                control_method=ZoneControlMethod.DAMPER,
+                has_sensor=False,
+                battery_status=SensorBatteryStatus.NORMAL,
+                temperature=None,
+                damper_percentage=100,
+                set_point=None,
+            ),
+        ]
+    )
+
+
+def test_decoder_truncated_buffer() -> None:
+    """A buffer missing whole zones should fail to decode."""
+    decoder = ZoneStatusDecoder()
+    header = ControlStatusSubHeader(
+        sub_message_id=MESSAGE_ID,
+        non_repeat_length=0,
+        repeat_length=8,
+        repeat_count=3,
+    )
+    message_buffer = bytes(
+        (
+            # Zone 1
+            0x40,
+            0x80,
+            0x96,
+            0x80,
+            0x02,
+            0xE7,
+            0x00,
+            0x00,
+            # Zone 2
+            0x01,
+            0x64,
+            0xFF,
+            0x00,
+            0x07,
+            0xFF,
+            0x00,
+            0x00,
+            # Zone 3 missing
+        )
+    )
+
+    with pytest.raises(comms.DecodeError):
+        decoder.decode(message_buffer, header)
@@ -0,0 +1 @@
+"""Tests for the pyairtouch.comms package."""
@@ -0,0 +1,80 @@
+import asyncio
+import dataclasses
+import socket
+import time
+from typing import Any, cast
+
+from pyairtouch.at5.comms import discovery as at5_discovery
+from pyairtouch.comms.discovery import _DISCOVERY_REQUEST_INTERVAL, AirTouchDiscoverer
+from typing_extensions import override
+
+_LOOPBACK = "127.0.0.1"
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind((_LOOPBACK, 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+class _Responder(asyncio.DatagramProtocol):
+    """Replies to every discovery request like an AirTouch 5 console."""
+
+    def __init__(self, reply_port: int) -> None:
+        self._reply_port = reply_port
+        self._transport: asyncio.DatagramTransport | None = None
+
+    @override
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = cast(asyncio.DatagramTransport, transport)
+
+    @override
+    def datagram_received(self, data: bytes, addr: tuple[str | Any, int]) -> None:
+        assert self._transport
+        self._transport.sendto(
+            f"{_LOOPBACK},123,AirTouch5,456,Name".encode(),
+            (_LOOPBACK, self._reply_port),
+        )
+
+
+async def _search_with_responder(
+    remote_host: str,
+) -> tuple[list[at5_discovery.At5DiscoveryResponse], float]:
+    config = dataclasses.replace(
+        at5_discovery.CONFIG, local_port=_free_port(), remote_port=_free_port()
+    )
+
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: _Responder(config.local_port),
+        local_addr=(_LOOPBACK, config.remote_port),
+    )
+    try:
+        discoverer = AirTouchDiscoverer(config, remote_host=remote_host)
+        start = time.monotonic()
+        responses = await discoverer.search()
+        elapsed = time.monotonic() - start
+    finally:
+        transport.close()
+
+    return list(responses), elapsed
+
+
+def test_unicast_search_returns_early() -> None:
+    responses, elapsed = asyncio.run(_search_with_responder(_LOOPBACK))
+
+    assert responses == [
+        at5_discovery.At5DiscoveryResponse(
+            airtouch_id="456", name="Name", serial="123", host=_LOOPBACK
+        )
+    ]
+    # Shouldn't wait out the request interval once the console has replied.
+    assert elapsed < _DISCOVERY_REQUEST_INTERVAL
+
+
+def test_unresolvable_host() -> None:
+    # The .invalid TLD is reserved and guaranteed never to resolve.
+    responses, _ = asyncio.run(_search_with_responder("airtouch.invalid"))
+
+    assert responses == []